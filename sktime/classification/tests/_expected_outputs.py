@@ -487,3 +487,11 @@ basic_motions_proba["ShapeletTransformClassifier"] = np.array(
         [0.2, 0.6, 0.0, 0.2],
     ]
 )
+
+# expected probabilities are only compared up to 2 decimals, so float32 suffices
+unit_test_proba = {
+    name: proba.astype(np.float32) for name, proba in unit_test_proba.items()
+}
+basic_motions_proba = {
+    name: proba.astype(np.float32) for name, proba in basic_motions_proba.items()
+}
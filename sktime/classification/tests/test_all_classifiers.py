@@ -3,6 +3,7 @@
 
 __author__ = ["mloning", "TonyBagnall", "fkiraly"]
 
+from functools import lru_cache
 
 import numpy as np
 import pytest
@@ -23,6 +24,29 @@ from sktime.utils._testing.scenarios_classification import (
 )
 
 
+@lru_cache(maxsize=None)
+def _load_data_cached(loader, seed):
+    """Load train/test data and draw subsample indices, once per loader and seed."""
+    X_train, y_train = loader(split="train")
+    X_test, _ = loader(split="test")
+    indices = np.random.RandomState(seed).choice(len(y_train), 10, replace=False)
+    return X_train, y_train, X_test, indices
+
+
+def _load_data(loader, seed):
+    """Return copies of the cached data, including the series in nested cells.
+
+    Classifiers that mutate their input thus cannot affect later tests.
+    """
+    X_train, y_train, X_test, indices = _load_data_cached(loader, seed)
+    return (
+        X_train.applymap(lambda s: s.copy()),
+        y_train.copy(),
+        X_test.applymap(lambda s: s.copy()),
+        indices.copy(),
+    )
+
+
 class ClassifierFixtureGenerator(BaseFixtureGenerator):
     """Fixture generator for classifier tests.
 
@@ -89,7 +113,7 @@ class TestAllClassifiers(ClassifierFixtureGenerator, QuickTester):
         # check predict
         assert isinstance(y_pred, np.ndarray)
         assert y_pred.shape == (X_new_instances,)
-        assert np.all(np.isin(np.unique(y_pred), np.unique(y_train)))
+        assert set(y_pred).issubset(y_train)
 
         # check predict proba (all classifiers have predict_proba by default)
         y_proba = scenario.run(estimator_instance, method_sequence=["predict_proba"])
@@ -136,10 +160,8 @@ class TestAllClassifiers(ClassifierFixtureGenerator, QuickTester):
         if "random_state" in estimator_instance.get_params().keys():
             estimator_instance.set_params(random_state=0)
 
-        # load unit test data
-        X_train, y_train = load_unit_test(split="train")
-        X_test, _ = load_unit_test(split="test")
-        indices = np.random.RandomState(0).choice(len(y_train), 10, replace=False)
+        # load unit test data, cached across classifiers
+        X_train, y_train, X_test, indices = _load_data(load_unit_test, seed=0)
 
         # train classifier and predict probas
         estimator_instance.fit(X_train, y_train)
@@ -168,10 +190,8 @@ class TestAllClassifiers(ClassifierFixtureGenerator, QuickTester):
         if "random_state" in estimator_instance.get_params().keys():
             estimator_instance.set_params(random_state=0)
 
-        # load unit test data
-        X_train, y_train = load_basic_motions(split="train")
-        X_test, _ = load_basic_motions(split="test")
-        indices = np.random.RandomState(4).choice(len(y_train), 10, replace=False)
+        # load basic motions data, cached across classifiers
+        X_train, y_train, X_test, indices = _load_data(load_basic_motions, seed=4)
 
         # train classifier and predict probas
         estimator_instance.fit(X_train.iloc[indices], y_train[indices])
@@ -21,6 +21,7 @@ from sktime.distances._numba_utils import (
     to_numba_timeseries,
 )
 from sktime.distances._resolve_metric import (
+    _is_known_metric,
     _resolve_dist_instance,
     _resolve_metric_to_factory,
 )
@@ -2019,7 +2020,13 @@ def pairwise_distance(
     _metric_callable = _resolve_metric_to_factory(
         metric, _x[0], _y[0], _METRIC_INFOS, **kwargs
     )
-    return _compute_pairwise_distance(_x, _y, symmetric, _metric_callable)
+    return _compute_pairwise_distance(
+        _x,
+        _y,
+        symmetric,
+        _metric_callable,
+        known_signature=_is_known_metric(metric, _METRIC_INFOS),
+    )
 
 
 def distance_alignment_path(
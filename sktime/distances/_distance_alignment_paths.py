@@ -53,9 +53,9 @@ def compute_min_return_path(
         else:
             arr = np.array(
                 [
-                    cost_matrix[i - 1][j - 1],
-                    cost_matrix[i - 1][j],
-                    cost_matrix[i][j - 1],
+                    cost_matrix[i - 1, j - 1],
+                    cost_matrix[i - 1, j],
+                    cost_matrix[i, j - 1],
                 ]
             )
 
@@ -111,12 +111,12 @@ def compute_lcss_return_path(
         if np.isfinite(bounding_matrix[i - 1, j - 1]):
             curr_dist = 0
             for k in range(dimensions):
-                curr_dist += (x[k][i - 1] - y[k][j - 1]) ** 2
+                curr_dist += (x[k, i - 1] - y[k, j - 1]) ** 2
             curr_dist = np.sqrt(curr_dist)
             if curr_dist <= epsilon:
                 path.append((i - 1, j - 1))
                 i, j = (i - 1, j - 1)
-            elif cost_matrix[i - 1][j] > cost_matrix[i][j - 1]:
+            elif cost_matrix[i - 1, j] > cost_matrix[i, j - 1]:
                 i = i - 1
             else:
                 j = j - 1
@@ -2,6 +2,7 @@
 __author__ = ["chrisholder", "TonyBagnall"]
 
 import warnings
+from functools import lru_cache
 from typing import Any, List, Tuple
 
 import numpy as np
@@ -185,19 +186,82 @@ class _DtwDistance(NumbaDistance):
             If the sakoe_chiba_window_radius is not an integer.
             If the itakura_max_slope is not a float or int.
         """
+        if (
+            bounding_matrix is None
+            and x.shape[-1] * y.shape[-1] <= _MAX_CACHED_BOUNDING_MATRIX_SIZE
+            and _is_hashable(window, itakura_max_slope)
+        ):
+            return _make_dtw_distance(
+                x.shape[-1], y.shape[-1], window, itakura_max_slope
+            )
+
         _bounding_matrix = resolve_bounding_matrix(
             x, y, window, itakura_max_slope, bounding_matrix
         )
+        return _dtw_distance_from_bounding_matrix(_bounding_matrix)
+
+
+# largest bounding matrix (number of entries) kept alive by the callable cache,
+#   bounds the cache at 32 * 250_000 float64 entries, i.e., about 64 MB
+_MAX_CACHED_BOUNDING_MATRIX_SIZE = 250_000
+
+
+@lru_cache(maxsize=32, typed=True)
+def _make_dtw_distance(
+    x_size: int, y_size: int, window: float, itakura_max_slope: float
+) -> DistanceCallable:
+    """Create a dtw distance callable specialised to fixed series lengths.
+
+    The callable is cached on series lengths and bounding parameters, so repeated
+    calls, e.g., on series of uniform length, reuse one compiled callable instead of
+    compiling a new one for every call. The cache is typed, so parameters that
+    compare equal but differ in type (e.g., 1 and 1.0) are validated separately.
+
+    Parameters
+    ----------
+    x_size: int
+        Length of the first time series.
+    y_size: int
+        Length of the second time series.
+    window: Float
+        Radius of the sakoe chiba window, or None.
+    itakura_max_slope: float
+        Gradient of the slope for itakura parallelogram, or None.
+
+    Returns
+    -------
+    Callable[[np.ndarray, np.ndarray], float]
+        No_python compiled Dtw distance callable.
+    """
+    _bounding_matrix = resolve_bounding_matrix(
+        np.zeros((1, x_size)), np.zeros((1, y_size)), window, itakura_max_slope
+    )
+    return _dtw_distance_from_bounding_matrix(_bounding_matrix)
+
+
+def _dtw_distance_from_bounding_matrix(
+    _bounding_matrix: np.ndarray,
+) -> DistanceCallable:
+    """Create a no_python compiled dtw distance callable for a bounding matrix."""
+
+    @njit(cache=True)
+    def numba_dtw_distance(
+        _x: np.ndarray,
+        _y: np.ndarray,
+    ) -> float:
+        cost_matrix = _cost_matrix(_x, _y, _bounding_matrix)
+        return cost_matrix[-1, -1]
+
+    return numba_dtw_distance
 
-        @njit(cache=True)
-        def numba_dtw_distance(
-            _x: np.ndarray,
-            _y: np.ndarray,
-        ) -> float:
-            cost_matrix = _cost_matrix(_x, _y, _bounding_matrix)
-            return cost_matrix[-1, -1]
 
-        return numba_dtw_distance
+def _is_hashable(*args: Any) -> bool:
+    """Check whether all args are hashable, i.e., can be used as cache keys."""
+    try:
+        hash(args)
+    except TypeError:
+        return False
+    return True
 
 
 @njit(cache=True)
@@ -237,7 +301,8 @@ def _cost_matrix(
             if np.isfinite(bounding_matrix[i, j]):
                 sum = 0
                 for k in range(dimensions):
-                    sum += (x[k][i] - y[k][j]) ** 2
+                    diff = x[k, i] - y[k, j]
+                    sum += diff * diff
                 cost_matrix[i + 1, j + 1] = sum
                 cost_matrix[i + 1, j + 1] += min(
                     cost_matrix[i, j + 1], cost_matrix[i + 1, j], cost_matrix[i, j]
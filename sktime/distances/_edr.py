@@ -241,9 +241,8 @@ def _edr_cost_matrix(
             if np.isfinite(bounding_matrix[i - 1, j - 1]):
                 curr_dist = 0
                 for k in range(dimensions):
-                    curr_dist += (x[k][i - 1] - y[k][j - 1]) * (
-                        x[k][i - 1] - y[k][j - 1]
-                    )
+                    diff = x[k, i - 1] - y[k, j - 1]
+                    curr_dist += diff * diff
                 curr_dist = np.sqrt(curr_dist)
                 if curr_dist < epsilon:
                     cost = 0
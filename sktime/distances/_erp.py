@@ -205,11 +205,11 @@ def _erp_cost_matrix(
     gy_distance = np.zeros(y_size)
     for j in range(x_size):
         for i in range(dimensions):
-            gx_distance[j] += (x[i][j] - g) * (x[i][j] - g)
+            gx_distance[j] += (x[i, j] - g) * (x[i, j] - g)
         gx_distance[j] = np.sqrt(gx_distance[j])
     for j in range(y_size):
         for i in range(dimensions):
-            gy_distance[j] += (y[i][j] - g) * (y[i][j] - g)
+            gy_distance[j] += (y[i, j] - g) * (y[i, j] - g)
         gy_distance[j] = np.sqrt(gy_distance[j])
     cost_matrix[1:, 0] = np.sum(gx_distance)
     cost_matrix[0, 1:] = np.sum(gy_distance)
@@ -219,9 +219,8 @@ def _erp_cost_matrix(
             if np.isfinite(bounding_matrix[i - 1, j - 1]):
                 curr_dist = 0
                 for k in range(dimensions):
-                    curr_dist += (x[k][i - 1] - y[k][j - 1]) * (
-                        x[k][i - 1] - y[k][j - 1]
-                    )
+                    diff = x[k, i - 1] - y[k, j - 1]
+                    curr_dist += diff * diff
                 curr_dist = np.sqrt(curr_dist)
                 cost_matrix[i, j] = min(
                     cost_matrix[i - 1, j - 1] + curr_dist,
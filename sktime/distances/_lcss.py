@@ -262,7 +262,7 @@ def _sequence_cost_matrix(
             if np.isfinite(bounding_matrix[i - 1, j - 1]):
                 curr_dist = 0
                 for k in range(dimensions):
-                    curr_dist += (x[k][i - 1] - y[k][j - 1]) ** 2
+                    curr_dist += (x[k, i - 1] - y[k, j - 1]) ** 2
                 curr_dist = np.sqrt(curr_dist)
                 if curr_dist <= epsilon:
                     cost_matrix[i, j] = 1 + cost_matrix[i - 1, j - 1]
@@ -186,7 +186,7 @@ class _MsmDistance(NumbaDistance):
 def _dimension_sum(x: np.ndarray, j: int):
     total = 0
     for i in range(x.shape[0]):
-        total += x[i][j]
+        total += x[i, j]
 
     return total
 
@@ -264,21 +264,21 @@ def _cost_matrix(
     y_size = y.shape[1]
     cost = np.zeros((x_size, y_size))
     # init the first cell
-    if x[0][0] > y[0][0]:
-        cost[0, 0] = x[0][0] - y[0][0]
+    if x[0, 0] > y[0, 0]:
+        cost[0, 0] = x[0, 0] - y[0, 0]
     else:
-        cost[0, 0] = y[0][0] - x[0][0]
+        cost[0, 0] = y[0, 0] - x[0, 0]
     # init the rest of the first row and column
     for i in range(1, x_size):
-        cost[i][0] = cost[i - 1][0] + _cost_function(x[0][i], x[0][i - 1], y[0][0], c)
+        cost[i, 0] = cost[i - 1, 0] + _cost_function(x[0, i], x[0, i - 1], y[0, 0], c)
     for i in range(1, y_size):
-        cost[0][i] = cost[0][i - 1] + _cost_function(y[0][i], y[0][i - 1], x[0][0], c)
+        cost[0, i] = cost[0, i - 1] + _cost_function(y[0, i], y[0, i - 1], x[0, 0], c)
     for i in range(1, x_size):
         for j in range(1, y_size):
             if np.isfinite(bounding_matrix[i, j]):
-                d1 = cost[i - 1][j - 1] + np.abs(x[0][i] - y[0][j])
-                d2 = cost[i - 1][j] + _cost_function(x[0][i], x[0][i - 1], y[0][j], c)
-                d3 = cost[i][j - 1] + _cost_function(y[0][j], x[0][i], y[0][j - 1], c)
+                d1 = cost[i - 1, j - 1] + np.abs(x[0, i] - y[0, j])
+                d2 = cost[i - 1, j] + _cost_function(x[0, i], x[0, i - 1], y[0, j], c)
+                d3 = cost[i, j - 1] + _cost_function(y[0, j], x[0, i], y[0, j - 1], c)
 
             temp = d1
             if d2 < temp:
@@ -286,6 +286,6 @@ def _cost_matrix(
             if d3 < temp:
                 temp = d3
 
-            cost[i][j] = temp
+            cost[i, j] = temp
 
     return cost[0:, 0:]
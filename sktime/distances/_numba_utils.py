@@ -4,7 +4,7 @@ __author__ = ["chrisholder", "TonyBagnall"]
 from typing import Callable
 
 import numpy as np
-from numba import njit
+from numba import njit, prange, types
 
 from sktime.distances.base import DistanceCallable
 
@@ -50,7 +50,11 @@ def _make_3d_series(x: np.ndarray) -> np.ndarray:
 
 
 def _compute_pairwise_distance(
-    x: np.ndarray, y: np.ndarray, symmetric: bool, distance_callable: DistanceCallable
+    x: np.ndarray,
+    y: np.ndarray,
+    symmetric: bool,
+    distance_callable: DistanceCallable,
+    known_signature: bool = False,
 ) -> np.ndarray:
     """Compute pairwise distance between two numpy arrays.
 
@@ -66,6 +70,11 @@ def _compute_pairwise_distance(
     distance_callable: Callable[[np.ndarray, np.ndarray], float]
         No_python distance callable to measure the distance between two 2d numpy
         arrays.
+    known_signature: bool, defaults = False
+        Whether distance_callable is known to take two 2d float64 arrays and return
+        a float64, i.e., was returned by one of the distance factories in this
+        package. If True, uses a compiled and parallel pairwise loop. Otherwise,
+        e.g., for user defined callables, loops over pairs in python.
 
     Returns
     -------
@@ -74,6 +83,12 @@ def _compute_pairwise_distance(
     """
     _x = _make_3d_series(x)
     _y = _make_3d_series(y)
+
+    if known_signature:
+        _x = np.ascontiguousarray(_x, dtype=np.float64)
+        _y = np.ascontiguousarray(_y, dtype=np.float64)
+        return _numba_pairwise_distance(_x, _y, symmetric, distance_callable)
+
     x_size = _x.shape[0]
     y_size = _y.shape[0]
 
@@ -89,6 +104,67 @@ def _compute_pairwise_distance(
     return pairwise_matrix
 
 
+# distance_callable is typed as a first-class function, so the pairwise loop is
+#   compiled once, rather than once per distance callable returned by a factory
+_distance_callable_type = types.FunctionType(
+    types.float64(types.float64[:, ::1], types.float64[:, ::1])
+)
+
+
+@njit(
+    types.float64[:, ::1](
+        types.float64[:, :, ::1],
+        types.float64[:, :, ::1],
+        types.boolean,
+        _distance_callable_type,
+    ),
+    cache=True,
+    parallel=True,
+)
+def _numba_pairwise_distance(
+    x: np.ndarray, y: np.ndarray, symmetric: bool, distance_callable: DistanceCallable
+) -> np.ndarray:
+    """Compute pairwise distance between two 3d float numpy arrays.
+
+    Rows of the pairwise matrix are computed in parallel. In the symmetric case,
+    only the upper triangle is computed, and mirrored afterwards.
+
+    Parameters
+    ----------
+    x: np.ndarray (3d C-contiguous float array)
+        First panel of time series.
+    y: np.ndarray (3d C-contiguous float array)
+        Second panel of time series.
+    symmetric: bool
+        Boolean that is true when distance_callable(x,y) == distance_callable(y,x).
+    distance_callable: Callable[[np.ndarray, np.ndarray], float]
+        No_python distance callable with signature
+        float64(float64[:, ::1], float64[:, ::1]).
+
+    Returns
+    -------
+    np.ndarray (2d of size mxn where m is len(x) and n is len(y)).
+        Pairwise distance matrix between the two time series.
+    """
+    x_size = x.shape[0]
+    y_size = y.shape[0]
+
+    pairwise_matrix = np.zeros((x_size, y_size))
+
+    for i in prange(x_size):
+        curr_x = x[i]
+        j_start = i if symmetric else 0
+        for j in range(j_start, y_size):
+            pairwise_matrix[i, j] = distance_callable(curr_x, y[j])
+
+    if symmetric:
+        for i in range(x_size):
+            for j in range(min(i, y_size)):
+                pairwise_matrix[i, j] = pairwise_matrix[j, i]
+
+    return pairwise_matrix
+
+
 def is_no_python_compiled_callable(
     no_python_callable: Callable, raise_error: bool = False
 ):
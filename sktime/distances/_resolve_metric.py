@@ -142,6 +142,38 @@ def _resolve_metric_to_factory(
     return metric
 
 
+def _is_known_metric(
+    metric: Union[str, Callable, NumbaDistance],
+    known_metric_dict: List[MetricInfo],
+) -> bool:
+    """Check if a metric resolves to one of the distances in this package.
+
+    Distance callables created by the factories of known distances take two 2d
+    float64 arrays and return a float64. User defined distance callables, factories
+    and NumbaDistance subclasses may not.
+
+    Parameters
+    ----------
+    metric: str or Callable or NumbaDistance
+        The distance metric to check.
+    known_metric_dict: List[MetricInfo]
+        List of known distance functions.
+
+    Returns
+    -------
+    bool
+        True if metric is the name, NumbaDistance instance or distance function of
+        a known distance, False otherwise.
+    """
+    for val in known_metric_dict:
+        if isinstance(metric, str):
+            if metric in val.aka:
+                return True
+        elif type(metric) is type(val.dist_instance) or metric is val.dist_func:
+            return True
+    return False
+
+
 def _resolve_str_metric(
     metric: str, known_metric_dict: List[MetricInfo]
 ) -> NumbaDistance:
@@ -271,7 +271,7 @@ def _twe_cost_matrix(
                 # Euclidean distance to x[:, i - 1] and y[:, i]
                 deletion_x_euclid_dist = 0
                 for k in range(dimensions):
-                    deletion_x_euclid_dist += (x[k][i - 1] - y[k][i]) ** 2
+                    deletion_x_euclid_dist += (x[k, i - 1] - y[k, i]) ** 2
                 deletion_x_euclid_dist = np.sqrt(deletion_x_euclid_dist)
 
                 del_x = cost_matrix[i - 1, j] + deletion_x_euclid_dist + delete_addition
@@ -280,7 +280,7 @@ def _twe_cost_matrix(
                 # Euclidean distance to x[:, j - 1] and y[:, j]
                 deletion_y_euclid_dist = 0
                 for k in range(dimensions):
-                    deletion_y_euclid_dist += (x[k][j - 1] - y[k][j]) ** 2
+                    deletion_y_euclid_dist += (x[k, j - 1] - y[k, j]) ** 2
                 deletion_y_euclid_dist = np.sqrt(deletion_y_euclid_dist)
 
                 del_y = cost_matrix[i, j - 1] + deletion_y_euclid_dist + delete_addition
@@ -289,13 +289,13 @@ def _twe_cost_matrix(
                 # Euclidean distance to x[:, i] and y[:, j]
                 match_same_euclid_dist = 0
                 for k in range(dimensions):
-                    match_same_euclid_dist += (x[k][i] - y[k][j]) ** 2
+                    match_same_euclid_dist += (x[k, i] - y[k, j]) ** 2
                 match_same_euclid_dist = np.sqrt(match_same_euclid_dist)
 
                 # Euclidean distance to x[:, i - 1] and y[:, j - 1]
                 match_previous_euclid_dist = 0
                 for k in range(dimensions):
-                    match_previous_euclid_dist += (x[k][i - 1] - y[k][j - 1]) ** 2
+                    match_previous_euclid_dist += (x[k, i - 1] - y[k, j - 1]) ** 2
                 match_previous_euclid_dist = np.sqrt(match_previous_euclid_dist)
 
                 match = (
@@ -239,16 +239,15 @@ def _weighted_cost_matrix(
     cost_matrix = np.full((x_size + 1, y_size + 1), np.inf)
     cost_matrix[0, 0] = 0.0
 
-    weight_vector = np.array(
-        [1 / (1 + np.exp(-g * (i - x_size / 2))) for i in range(0, x_size)]
-    )
+    weight_vector = 1 / (1 + np.exp(-g * (np.arange(x_size) - x_size / 2)))
 
     for i in range(x_size):
         for j in range(y_size):
             if np.isfinite(bounding_matrix[i, j]):
                 sum = 0
                 for k in range(dimensions):
-                    sum += (x[k][i] - y[k][j]) * (x[k][i] - y[k][j])
+                    diff = x[k, i] - y[k, j]
+                    sum += diff * diff
                 cost_matrix[i + 1, j + 1] = (
                     min(cost_matrix[i, j + 1], cost_matrix[i + 1, j], cost_matrix[i, j])
                     + weight_vector[np.abs(i - j)] * sum
@@ -1,7 +1,11 @@
 # -*- coding: utf-8 -*-
 # The key string (i.e. 'euclidean') must be the same as the name in _registry
+# Missing expected results are stored as np.nan.
+from types import MappingProxyType
 
-_expected_distance_results = {
+import numpy as np
+
+_raw_expected_distance_results = {
     # Result structure:
     # [single value series, univariate series, multivariate series]
     "euclidean": [5.0, 2.6329864895136623, 7.093596608755006],
@@ -13,11 +17,11 @@ _expected_distance_results = {
     "ddtw": [0.0, 2.0884818837222006, 34.837800040564005],
     "wdtw": [12.343758137512241, 0.985380547171357, 21.265839226825413],
     "wddtw": [0.0, 1.0442409418611003, 17.418900020282003],
-    "msm": [5.0, 3.0922226886554434, None],
+    "msm": [5.0, 3.0922226886554434, np.nan],
     "twe": [5.0, 11.548698748091073, 39.87793560457224],
 }
 
-_expected_distance_results_params = {
+_raw_expected_distance_results_params = {
     # Result structure:
     # [univariate series, multivariate series]
     "dtw": [
@@ -71,3 +75,26 @@ _expected_distance_results_params = {
         [11.548698748091073, 39.87793560457224],
     ],
 }
+
+
+def _read_only_array(value):
+    # float64 array that cannot be modified in place by tests
+    array = np.asarray(value, dtype=np.float64)
+    array.flags.writeable = False
+    return array
+
+
+# read-only views with one read-only float64 array per distance, built at import
+_expected_distance_results = MappingProxyType(
+    {
+        key: _read_only_array(value)
+        for key, value in _raw_expected_distance_results.items()
+    }
+)
+
+_expected_distance_results_params = MappingProxyType(
+    {
+        key: _read_only_array(value)
+        for key, value in _raw_expected_distance_results_params.items()
+    }
+)
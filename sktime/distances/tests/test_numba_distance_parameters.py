@@ -37,11 +37,10 @@ def _test_distance_params(
             results.append(distance(x, y, metric=distance_str, **param_dict))
             results.append(curr_dist_fact(x, y))
             if distance_str in _expected_distance_results_params:
-                if _expected_distance_results_params[distance_str][i][j] is not None:
+                expected = _expected_distance_results_params[distance_str][i, j]
+                if not np.isnan(expected):
                     for result in results:
-                        assert result == pytest.approx(
-                            _expected_distance_results_params[distance_str][i][j]
-                        )
+                        assert result == pytest.approx(expected)
             curr_results.append(results[0])
             j += 1
         i += 1
@@ -7,9 +7,15 @@ from typing import Callable
 
 import numpy as np
 import pytest
+from numba import njit
 from numpy.testing import assert_almost_equal
 
-from sktime.distances._distance import _METRIC_INFOS, distance, distance_factory
+from sktime.distances._distance import (
+    _METRIC_INFOS,
+    distance,
+    distance_factory,
+    pairwise_distance,
+)
 from sktime.distances.base import MetricInfo, NumbaDistance
 from sktime.distances.tests._expected_results import _expected_distance_results
 from sktime.distances.tests._shared_tests import (
@@ -50,9 +56,9 @@ def _validate_distance_result(
     kwargs_dict: dict
         Extra kwargs
     expected_result:
-        float that is the expected result of tests.
+        float that is the expected result of tests, nan if there is none.
     """
-    if expected_result is None:
+    if expected_result is None or np.isnan(expected_result):
         return
     if kwargs_dict is None:
         kwargs_dict = {}
@@ -143,8 +149,7 @@ def _validate_distance_result(
             f"the metric {metric_str}. The result was {metric_str_result_to_self}"
         )
 
-    if expected_result is not None:
-        assert_almost_equal(metric_str_result, expected_result, 5)
+    assert_almost_equal(metric_str_result, expected_result, 5)
 
 
 @pytest.mark.parametrize("dist", _METRIC_INFOS)
@@ -217,3 +222,44 @@ def test_distance_factory_1d():
 
     assert first == 14.906015491572047
     assert second == 422.81946268212846
+
+
+def test_dtw_cached_factory_validates_parameter_type():
+    """Test cached dtw callables do not bypass validation of equal-valued params."""
+    x = create_test_distance_numpy(10)
+    y = create_test_distance_numpy(10, random_state=2)
+
+    distance(x, y, metric="dtw", window=1.0)
+    with pytest.raises(ValueError, match="window must be a float"):
+        distance(x, y, metric="dtw", window=1)
+
+
+@njit(cache=True)
+def _constant_int_distance(x: np.ndarray, y: np.ndarray):
+    return 1
+
+
+@njit(cache=True)
+def _float32_distance(x: np.ndarray, y: np.ndarray):
+    return np.float32(np.sum(np.abs(x - y)))
+
+
+@njit("float64(float64[:, :], float64[:, :])", cache=True)
+def _explicit_signature_distance(x: np.ndarray, y: np.ndarray):
+    return np.sum(np.abs(x - y))
+
+
+def test_pairwise_distance_custom_metric():
+    """Test pairwise_distance with custom no_python callables of other signatures."""
+    X = create_test_distance_numpy(4, 2, 10)
+    expected = np.array(
+        [[np.sum(np.abs(X[i] - X[j])) for j in range(4)] for i in range(4)]
+    )
+
+    assert_almost_equal(
+        pairwise_distance(X, metric=_constant_int_distance), np.ones((4, 4))
+    )
+    assert_almost_equal(pairwise_distance(X, metric=_float32_distance), expected, 4)
+    assert_almost_equal(
+        pairwise_distance(X, metric=_explicit_signature_distance), expected
+    )
@@ -6,8 +6,12 @@
 __author__ = ["aiwalter", "SveaMeyer13", "fkiraly"]
 __all__ = ["OptionalPassthrough", "ColumnwiseTransformer", "YtoX"]
 
+import pickle
+from functools import partial
+
 import pandas as pd
 from sklearn.utils.metaestimators import if_delegate_has_method
+from sklearn.utils.validation import check_memory
 
 from sktime.transformations.base import BaseTransformer
 from sktime.utils.validation.series import check_series
@@ -126,6 +130,50 @@ class OptionalPassthrough(BaseTransformer):
             self.transformer_._fit(X, y)
         return self
 
+    def transform(self, X, y=None):
+        """Transform X and return a transformed version.
+
+        If `passthrough` is True, returns X unchanged, without input checks and
+        conversion. Otherwise, behaves as `BaseTransformer.transform`.
+
+        Parameters
+        ----------
+        X : Series or Panel, any supported mtype
+            Data to be transformed
+        y : Series or Panel, default=None
+            Additional data, e.g., labels for transformation
+
+        Returns
+        -------
+        transformed version of X
+        """
+        if self.passthrough:
+            self.check_is_fitted()
+            return X
+        return super(OptionalPassthrough, self).transform(X=X, y=y)
+
+    def inverse_transform(self, X, y=None):
+        """Inverse transform X and return an inverse transformed version.
+
+        If `passthrough` is True, returns X unchanged, without input checks and
+        conversion. Otherwise, behaves as `BaseTransformer.inverse_transform`.
+
+        Parameters
+        ----------
+        X : Series or Panel, any supported mtype
+            Data to be inverse transformed
+        y : Series or Panel, default=None
+            Additional data, e.g., labels for transformation
+
+        Returns
+        -------
+        inverse transformed version of X
+        """
+        if self.passthrough and self.get_tag("capability:inverse_transform"):
+            self.check_is_fitted()
+            return X
+        return super(OptionalPassthrough, self).inverse_transform(X=X, y=y)
+
     def _transform(self, X, y=None):
         """Transform X and return a transformed version.
 
@@ -189,7 +237,10 @@ class OptionalPassthrough(BaseTransformer):
         """
         from sktime.transformations.series.boxcox import BoxCoxTransformer
 
-        return {"transformer": BoxCoxTransformer(), "passthrough": False}
+        params1 = {"transformer": BoxCoxTransformer(), "passthrough": False}
+        params2 = {"transformer": BoxCoxTransformer(), "passthrough": True}
+
+        return [params1, params2]
 
 
 class ColumnwiseTransformer(BaseTransformer):
@@ -207,6 +258,11 @@ class ColumnwiseTransformer(BaseTransformer):
     columns : list of str or None
             Names of columns that are supposed to be transformed.
             If None, all columns are transformed.
+    memory : None, str or object with the joblib.Memory interface, default=None
+        Used to cache the transformers fitted to each column, so that refitting on
+        the same column with the same transformer parameters is skipped.
+        By default, no caching is performed. If a string is given, it is the path
+        to the caching directory.
 
     Attributes
     ----------
@@ -242,9 +298,10 @@ class ColumnwiseTransformer(BaseTransformer):
         "fit_is_empty": False,
     }
 
-    def __init__(self, transformer, columns=None):
+    def __init__(self, transformer, columns=None, memory=None):
         self.transformer = transformer
         self.columns = columns
+        self.memory = memory
         super(ColumnwiseTransformer, self).__init__()
 
         tags_to_clone = [
@@ -289,14 +346,23 @@ class ColumnwiseTransformer(BaseTransformer):
         # make sure z contains all columns that the user wants to transform
         _check_columns(X, selected_columns=self.columns_)
 
-        # fit by iterating over columns
-        self.transformers_ = {}
-        for colname in self.columns_:
-            transformer = self.transformer.clone()
-            self.transformers_[colname] = transformer
-            self.transformers_[colname].fit(X[colname], y)
+        # fit by iterating over columns, with caching of fitted transformers
+        memory = check_memory(self.memory)
+        _fit_one_cached = memory.cache(_fit_one)
+
+        # fitted transformers are stored in the same order as self.columns_
+        make_transformer = _make_cloner(self.transformer)
+        self._transformers_list = []
+        for _, col in X[self.columns_].items():
+            transformer = make_transformer()
+            self._transformers_list.append(_fit_one_cached(transformer, col, y))
         return self
 
+    @property
+    def transformers_(self):
+        """Maps columns to fitted transformers, dict of {str : transformer}."""
+        return dict(zip(self.columns_, self._transformers_list))
+
     def _transform(self, X, y=None):
         """Transform X and return a transformed version.
 
@@ -317,14 +383,17 @@ class ColumnwiseTransformer(BaseTransformer):
         Xt : pd.DataFrame
             transformed version of X
         """
-        # make copy of z
-        X = X.copy()
-
         # make sure z contains all columns that the user wants to transform
         _check_columns(X, selected_columns=self.columns_)
-        for colname in self.columns_:
-            X[colname] = self.transformers_[colname].transform(X[colname], y)
-        return X
+
+        # transform selected columns, then assemble them in a single step
+        Xt_cols = {
+            colname: transformer.transform(col, y)
+            for (colname, col), transformer in zip(
+                X[self.columns_].items(), self._transformers_list
+            )
+        }
+        return _replace_columns(X, Xt_cols)
 
     def _inverse_transform(self, X, y=None):
         """Logic used by `inverse_transform` to reverse transformation on `X`.
@@ -345,17 +414,17 @@ class ColumnwiseTransformer(BaseTransformer):
         Xt : pd.DataFrame
             inverse transformed version of X
         """
-        # make copy of z
-        X = X.copy()
-
         # make sure z contains all columns that the user wants to transform
         _check_columns(X, selected_columns=self.columns_)
 
-        # iterate over columns that are supposed to be inverse_transformed
-        for colname in self.columns_:
-            X[colname] = self.transformers_[colname].inverse_transform(X[colname], y)
-
-        return X
+        # inverse transform selected columns, then assemble them in a single step
+        Xt_cols = {
+            colname: transformer.inverse_transform(col, y)
+            for (colname, col), transformer in zip(
+                X[self.columns_].items(), self._transformers_list
+            )
+        }
+        return _replace_columns(X, Xt_cols)
 
     @if_delegate_has_method(delegate="transformer")
     def update(self, X, y=None, update_params=True):
@@ -377,14 +446,21 @@ class ColumnwiseTransformer(BaseTransformer):
         """
         z = check_series(X)
 
+        # in the univariate case, update the single transformer on z directly
+        if isinstance(z, pd.Series) and list(self.columns_) == [z.name]:
+            self._transformers_list[0].update(z, X)
+            return self
+
         # make z a pd.DataFrame in univariate case
         if isinstance(z, pd.Series):
             z = z.to_frame()
 
         # make sure z contains all columns that the user wants to transform
         _check_columns(z, selected_columns=self.columns_)
-        for colname in self.columns_:
-            self.transformers_[colname].update(z[colname], X)
+        for (_, col), transformer in zip(
+            z[self.columns_].items(), self._transformers_list
+        ):
+            transformer.update(col, X)
         return self
 
     @classmethod
@@ -413,20 +489,39 @@ class ColumnwiseTransformer(BaseTransformer):
 
 def _check_columns(z, selected_columns):
     # make sure z contains all columns that the user wants to transform
-    z_wanted_keys = set(selected_columns)
-    z_new_keys = set(z.columns)
-    difference = z_wanted_keys.difference(z_new_keys)
+    if selected_columns is z.columns:
+        return
+    difference = pd.Index(selected_columns).difference(z.columns, sort=False)
     if len(difference) != 0:
-        raise ValueError("Missing columns" + str(difference) + "in Z.")
-
-
-def _check_is_pdseries(z):
-    # make z a pd.Dataframe in univariate case
-    is_series = False
-    if isinstance(z, pd.Series):
-        z = z.to_frame()
-        is_series = True
-    return z, is_series
+        raise ValueError("Missing columns" + str(list(difference)) + "in Z.")
+
+
+def _make_cloner(transformer):
+    # return a callable that creates fresh, unfitted copies of transformer
+    #   clones once, then copies via pickle round-trip, which is much cheaper
+    #   than a clone per copy; falls back to clone if pickling is not possible
+    transformer = transformer.clone()
+    try:
+        template = pickle.dumps(transformer)
+    except Exception:
+        # pickling is only an optional speedup, clone always remains valid
+        return transformer.clone
+    return partial(pickle.loads, template)
+
+
+def _fit_one(transformer, X, y):
+    # fit a single transformer, used as the cached unit of work in fit
+    return transformer.fit(X, y)
+
+
+def _replace_columns(X, Xt_cols):
+    # replace columns of X by the series in dict Xt_cols, keeping column order
+    #   assembles the result in one concat instead of per-column assignment
+    Xt = pd.DataFrame(Xt_cols, index=X.index)
+    # untransformed columns only need to be added if some columns were not selected
+    if len(Xt.columns) < len(X.columns):
+        Xt = pd.concat([X.drop(columns=Xt.columns), Xt], axis=1)
+    return Xt.reindex(columns=X.columns, copy=False)
 
 
 class YtoX(BaseTransformer):
@@ -222,7 +222,7 @@ class Lag(BaseTransformer):
         index_out = self.index_out
 
         X_orig_idx = X.index
-        X = X.combine_first(self._X).copy()
+        X = X.combine_first(self._X)
 
         shift_params = list(self._yield_shift_params())
 
@@ -239,7 +239,7 @@ class Lag(BaseTransformer):
                 X_orig_idx_shifted = X_orig_idx.shift(periods=lag, freq=freq)
                 if isinstance(lag, int) and freq is None:
                     freq = "infer"
-                Xt = X.copy().shift(periods=lag, freq=freq)
+                Xt = X.shift(periods=lag, freq=freq)
             # extend index to include original, if "extend" or "original"
             if index_out in ["extend", "original"]:
                 X_idx = pd.DataFrame(index=X_orig_idx)
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""Tests for series meta-transformers in compose."""
+
+import pandas as pd
+
+from sktime.datasets import load_longley
+from sktime.transformations.series.compose import ColumnwiseTransformer
+from sktime.transformations.series.detrend import Detrender
+
+_, X = load_longley()
+
+
+class _FitCountingDetrender(Detrender):
+    """Detrender that counts calls to _fit, across all instances."""
+
+    n_fit_calls = 0
+
+    def _fit(self, X, y=None):
+        type(self).n_fit_calls += 1
+        return super(_FitCountingDetrender, self)._fit(X, y)
+
+
+def test_columnwise_transformer_memory(tmp_path):
+    """Test that fitted transformers are retrieved from the cache on refit."""
+    expected = ColumnwiseTransformer(Detrender()).fit_transform(X)
+
+    _FitCountingDetrender.n_fit_calls = 0
+    for _ in range(2):
+        transformer = ColumnwiseTransformer(
+            _FitCountingDetrender(), memory=str(tmp_path)
+        )
+        Xt = transformer.fit_transform(X)
+        pd.testing.assert_frame_equal(Xt, expected)
+
+    # one fit per column in the first run, none in the second (cache hits)
+    assert _FitCountingDetrender.n_fit_calls == X.shape[1]
+
+
+class _UnpicklableDetrender(Detrender):
+    """Detrender that raises a non-pickle error when pickled."""
+
+    def __reduce__(self):
+        raise NotImplementedError("cannot pickle")
+
+
+def test_columnwise_transformer_unpicklable():
+    """Test that fit falls back to clone if the transformer cannot be pickled."""
+    expected = ColumnwiseTransformer(Detrender()).fit_transform(X)
+    Xt = ColumnwiseTransformer(_UnpicklableDetrender()).fit_transform(X)
+    pd.testing.assert_frame_equal(Xt, expected)